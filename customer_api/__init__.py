@@ -1,2 +1,3 @@
 # __init__.py
-from . import controllers
\ No newline at end of file
+from . import controllers
+from . import models
\ No newline at end of file
@@ -5,34 +5,92 @@ from odoo import http, fields
 from odoo.http import request
 from werkzeug.exceptions import BadRequest, Unauthorized
 from odoo.exceptions import ValidationError, AccessError
+from odoo.addons.customer_api.models.product import (
+    get_cached_category_list,
+    get_cached_product_page,
+    set_cached_category_list,
+    set_cached_product_page,
+)
 import hashlib
-import secrets
 from datetime import datetime, timedelta
 
 _logger = logging.getLogger(__name__)
 
+# Record ids of xmlids used on every request, keyed by (dbname, xmlid)
+_XMLID_CACHE = {}
 
-class CustomerAPIController(http.Controller):
 
-    def _get_json_data(self):
-        """Helper method to extract JSON data from request"""
-        try:
-            # For Odoo 17, try multiple ways to get JSON data
-            if hasattr(request, 'get_json_data'):
-                return request.get_json_data()
-            elif hasattr(request, 'jsonrequest'):
-                return request.jsonrequest
-            elif request.httprequest.is_json:
-                return request.httprequest.get_json()
-            else:
-                # Fallback: read raw data and parse
-                raw_data = request.httprequest.get_data()
-                if raw_data:
-                    return json.loads(raw_data.decode('utf-8'))
-                return {}
-        except Exception as e:
-            _logger.error(f"Error getting JSON data: {e}")
-            return {}
+def _xmlid_to_id(xmlid):
+    """Resolve an xmlid to its record id, cached per database"""
+    key = (request.env.cr.dbname, xmlid)
+    if key not in _XMLID_CACHE:
+        _XMLID_CACHE[key] = request.env.ref(xmlid).id
+    return _XMLID_CACHE[key]
+
+
+_IMAGE_URL_SUFFIX = '/image_1920'
+
+# Typed payload fields of the endpoints: name -> (type, default)
+_PRODUCT_PAGE_PARAMS = {'limit': (int, 20), 'offset': (int, 0)}
+_ADD_TO_CART_PARAMS = {'product_id': (int, None), 'quantity': (float, 1)}
+
+
+def _read_request_body():
+    """Parse the raw request body as JSON"""
+    httprequest = request.httprequest
+    if httprequest.is_json:
+        return httprequest.get_json()
+    raw_data = httprequest.get_data()
+    if not raw_data:
+        return {}
+    try:
+        return json.loads(raw_data)
+    except ValueError as e:
+        _logger.error(f"Error getting JSON data: {e}")
+        return {}
+
+
+def _get_json_data_from_request():
+    """Return the JSON payload parsed by Odoo 16+ requests"""
+    return request.get_json_data()
+
+
+def _get_jsonrequest():
+    """Return the JSON payload of older Odoo JSON requests"""
+    return request.jsonrequest
+
+
+# Resolve once which API this Odoo version offers to read the JSON payload
+if hasattr(http.Request, 'get_json_data'):
+    _get_json_data = _get_json_data_from_request
+elif hasattr(http, 'JsonRequest'):
+    _get_json_data = _get_jsonrequest
+else:
+    _get_json_data = _read_request_body
+
+
+def _coerce_params(data, spec):
+    """Convert payload fields to their declared types, raising ValueError or TypeError on bad input"""
+    return {name: field_type(data.get(name, default)) for name, (field_type, default) in spec.items()}
+
+
+def _get_image_url_prefix():
+    """Return the product image URL up to the product id"""
+    return request.httprequest.host_url.rstrip('/') + '/web/image/product.product/'
+
+
+def _get_image_product_ids(products):
+    """Return the set of product ids having an image, without reading the binaries"""
+    if not products:
+        return set()
+    # Archived products (e.g. in older cart lines) still have their image
+    return set(request.env['product.product'].sudo().with_context(active_test=False).search([
+        ('id', 'in', products.ids),
+        '|', ('image_variant_1920', '!=', False), ('product_tmpl_id.image_1920', '!=', False),
+    ]).ids)
+
+
+class CustomerAPIController(http.Controller):
 
     @http.route('/api/customer/create', type='json', auth='public', methods=['POST'], csrf=False)
     def create_customer(self, **kw):
@@ -47,7 +105,7 @@ class CustomerAPIController(http.Controller):
         """
         try:
             # Get JSON data from request
-            data = self._get_json_data()
+            data = _get_json_data()
             _logger.info(f"Received data for customer creation: {data}")
 
             # If data is empty, try kw as fallback
@@ -66,47 +124,37 @@ class CustomerAPIController(http.Controller):
             if not email or '@' not in email:
                 return {'status': 'error', 'message': 'Invalid email format'}
 
-            # Check if email already exists
-            existing_partner = request.env['res.partner'].sudo().search([
-                ('email', '=', email),
-                ('is_company', '=', False)
-            ], limit=1)
+            # Check if a partner or user already uses this email, in one round-trip
+            request.env.cr.execute("""
+                SELECT EXISTS(SELECT 1 FROM res_partner
+                               WHERE email = %s AND is_company IS NOT TRUE AND active),
+                       EXISTS(SELECT 1 FROM res_users
+                               WHERE login = %s AND active)
+            """, (email, email))
+            partner_exists, user_exists = request.env.cr.fetchone()
 
-            if existing_partner:
+            if partner_exists:
                 return {'status': 'error', 'message': 'Email already exists'}
 
-            # Check if user with this login already exists
-            existing_user = request.env['res.users'].sudo().search([
-                ('login', '=', email)
-            ], limit=1)
-
-            if existing_user:
+            if user_exists:
                 return {'status': 'error', 'message': 'User with this email already exists'}
 
-            # Create the customer
-            partner_vals = {
+            # Create the user account for login together with its customer partner
+            user_vals = {
                 'name': data['name'].strip(),
+                'login': email,
                 'email': email,
                 'phone': data.get('phone', '').strip(),
                 'is_company': False,
                 'customer_rank': 1,
                 'supplier_rank': 0,
-            }
-
-            partner = request.env['res.partner'].sudo().create(partner_vals)
-
-            # Create user account for login
-            user_vals = {
-                'name': data['name'].strip(),
-                'login': email,
-                'email': email,
-                'partner_id': partner.id,
                 'password': data['password'],
-                'groups_id': [(6, 0, [request.env.ref('base.group_portal').id])],
+                'groups_id': [(6, 0, [_xmlid_to_id('base.group_portal')])],
                 'active': True,
             }
 
             user = request.env['res.users'].sudo().create(user_vals)
+            partner = user.partner_id
 
             return {
                 'status': 'success',
@@ -134,7 +182,7 @@ class CustomerAPIController(http.Controller):
         """
         try:
             # Get JSON data from request
-            data = self._get_json_data()
+            data = _get_json_data()
             _logger.info(f"Received data for login: {data}")
 
             # If data is empty, try kw as fallback
@@ -158,25 +206,30 @@ class CustomerAPIController(http.Controller):
             if not uid:
                 return {'status': 'error', 'message': 'Invalid email or password'}
 
-            # Get user and partner information
+            # Get user and partner information in one read
             user = request.env['res.users'].sudo().browse(uid)
-            partner = user.partner_id
-
-            # Check if user has portal access
-            if not user.has_group('base.group_portal') and not user.has_group('base.group_user'):
+            user_data = user.read(['partner_id', 'name', 'email'])[0]
+
+            # Check if user has portal or internal access, in one query
+            request.env.cr.execute("""
+                SELECT 1 FROM res_groups_users_rel
+                 WHERE uid = %s AND gid = ANY(%s)
+                 LIMIT 1
+            """, (uid, [_xmlid_to_id('base.group_portal'), _xmlid_to_id('base.group_user')]))
+            if not request.env.cr.fetchone():
                 return {'status': 'error', 'message': 'Access denied'}
 
-            # Generate session token (optional, for API authentication)
-            session_token = secrets.token_hex(32)
+            # Warm the partner cache used by the cart endpoints
+            user._get_api_partner_info()
 
             return {
                 'status': 'success',
                 'message': 'Login successful',
                 'user_id': uid,
-                'customer_id': partner.id,
-                'customer_name': partner.name,
-                'customer_email': partner.email,
-                'session_token': session_token,
+                'customer_id': user_data['partner_id'][0],
+                'customer_name': user_data['name'],
+                'customer_email': user_data['email'],
+                'session_token': request.session.sid,
                 'session_id': request.session.sid
             }
 
@@ -187,23 +240,65 @@ class CustomerAPIController(http.Controller):
 
 class ProductAPIController(http.Controller):
 
-    def _get_json_data(self):
-        """Helper method to extract JSON data from request"""
+    def _get_product_page(self, domain, limit, offset, image_url_prefix):
+        """Search and serialize one page of products"""
+        # Search and read the page of products in one query
+        Product = request.env['product.product'].sudo()
+        product_rows = Product.search_read(domain, [
+            'name', 'description_sale', 'description', 'list_price', 'currency_id',
+            'categ_id', 'uom_id', 'default_code', 'sale_ok', 'active',
+        ], limit=limit, offset=offset, order='name asc')
+        products = Product.browse([row['id'] for row in product_rows])
+        category_names = {categ.id: categ.name for categ in products.mapped('categ_id')}
+
+        # Products having an image, without loading the image binaries
+        image_product_ids = _get_image_product_ids(products)
+
+        # Get stock quantities in one batch (if inventory module is installed)
         try:
-            if hasattr(request, 'get_json_data'):
-                return request.get_json_data()
-            elif hasattr(request, 'jsonrequest'):
-                return request.jsonrequest
-            elif request.httprequest.is_json:
-                return request.httprequest.get_json()
-            else:
-                raw_data = request.httprequest.get_data()
-                if raw_data:
-                    return json.loads(raw_data.decode('utf-8'))
-                return {}
-        except Exception as e:
-            _logger.error(f"Error getting JSON data: {e}")
-            return {}
+            stock_qtys = dict(zip(products.ids, products.mapped('qty_available')))
+        except Exception:
+            stock_qtys = {}
+
+        # Format product data
+        product_list = []
+        company_currency = request.env.company.currency_id.name
+
+        for row in product_rows:
+            product_id = row['id']
+            categ = row['categ_id']
+            image_url = image_url_prefix + str(product_id) + _IMAGE_URL_SUFFIX if product_id in image_product_ids else None
+
+            product_data = {
+                'id': product_id,
+                'name': row['name'],
+                'description': row['description_sale'] or row['description'] or '',
+                'price': float(row['list_price']),
+                'currency': row['currency_id'][1] if row['currency_id'] else company_currency,
+                'category': category_names.get(categ[0], '') if categ else '',
+                'category_id': categ[0] if categ else None,
+                'available_qty': stock_qtys.get(product_id, 0),
+                'image_url': image_url,
+                'uom': row['uom_id'][1] if row['uom_id'] else '',
+                'sku': row['default_code'] or '',
+                'is_available': row['sale_ok'] and row['active'],
+            }
+            product_list.append(product_data)
+
+        # Get total count, which is already known when the page is not full
+        if len(product_rows) < limit and (product_rows or offset == 0):
+            total_count = offset + len(product_rows)
+        else:
+            total_count = Product.search_count(domain)
+
+        return {
+            'status': 'success',
+            'products': product_list,
+            'total_count': total_count,
+            'limit': limit,
+            'offset': offset,
+            'has_more': (offset + limit) < total_count
+        }
 
     @http.route('/api/products', type='json', auth='public', methods=['POST'], csrf=False)
     def list_products(self, **kw):
@@ -217,7 +312,7 @@ class ProductAPIController(http.Controller):
         }
         """
         try:
-            data = self._get_json_data()
+            data = _get_json_data()
             if not data:
                 data = kw
 
@@ -245,57 +340,23 @@ class ProductAPIController(http.Controller):
 
             # Get limit and offset
             try:
-                limit = min(int(data.get('limit', 20)), 100)  # Max 100 products per request
-                offset = max(int(data.get('offset', 0)), 0)
+                params = _coerce_params(data, _PRODUCT_PAGE_PARAMS)
+                limit = min(params['limit'], 100)  # Max 100 products per request
+                offset = max(params['offset'], 0)
             except (ValueError, TypeError):
                 return {'status': 'error', 'message': 'Invalid limit or offset format'}
 
-            # Search products
-            products = request.env['product.product'].sudo().search(
-                domain, limit=limit, offset=offset, order='name asc'
+            # Serve repeated listings from the page cache
+            image_url_prefix = _get_image_url_prefix()
+            cache_key = (
+                request.env.cr.dbname, request.env.lang, request.env.company.id,
+                image_url_prefix, tuple(domain), limit, offset,
             )
-
-            # Format product data
-            product_list = []
-            base_url = request.httprequest.host_url.rstrip('/')
-
-            for product in products:
-                # Get product images
-                image_url = f'{base_url}/web/image/product.product/{product.id}/image_1920' if product.image_1920 else None
-
-                # Get stock quantity (if inventory module is installed)
-                try:
-                    stock_qty = product.qty_available
-                except:
-                    stock_qty = 0
-
-                product_data = {
-                    'id': product.id,
-                    'name': product.name,
-                    'description': product.description_sale or product.description or '',
-                    'price': float(product.list_price),
-                    'currency': product.currency_id.name if product.currency_id else request.env.company.currency_id.name,
-                    'category': product.categ_id.name if product.categ_id else '',
-                    'category_id': product.categ_id.id if product.categ_id else None,
-                    'available_qty': stock_qty,
-                    'image_url': image_url,
-                    'uom': product.uom_id.name if product.uom_id else '',
-                    'sku': product.default_code or '',
-                    'is_available': product.sale_ok and product.active,
-                }
-                product_list.append(product_data)
-
-            # Get total count
-            total_count = request.env['product.product'].sudo().search_count(domain)
-
-            return {
-                'status': 'success',
-                'products': product_list,
-                'total_count': total_count,
-                'limit': limit,
-                'offset': offset,
-                'has_more': (offset + limit) < total_count
-            }
+            result = get_cached_product_page(cache_key)
+            if result is None:
+                result = self._get_product_page(domain, limit, offset, image_url_prefix)
+                set_cached_product_page(cache_key, result)
+            return result
 
         except Exception as e:
             _logger.error(f"Error listing products: {str(e)}")
@@ -304,24 +365,6 @@ class ProductAPIController(http.Controller):
 
 class CartAPIController(http.Controller):
 
-    def _get_json_data(self):
-        """Helper method to extract JSON data from request"""
-        try:
-            if hasattr(request, 'get_json_data'):
-                return request.get_json_data()
-            elif hasattr(request, 'jsonrequest'):
-                return request.jsonrequest
-            elif request.httprequest.is_json:
-                return request.httprequest.get_json()
-            else:
-                raw_data = request.httprequest.get_data()
-                if raw_data:
-                    return json.loads(raw_data.decode('utf-8'))
-                return {}
-        except Exception as e:
-            _logger.error(f"Error getting JSON data: {e}")
-            return {}
-
     def _authenticate_session(self):
         """Check if user is authenticated - Fixed version"""
         try:
@@ -331,19 +374,18 @@ class CartAPIController(http.Controller):
                 return False
 
             # Check if user is authenticated (not public user)
-            public_user_id = request.env.ref('base.public_user').id
-            if not request.uid or request.uid == public_user_id:
-                _logger.error(f"User not authenticated. UID: {request.uid}, Public UID: {public_user_id}")
+            user = request.env.user
+            if not request.uid or user._is_public():
+                _logger.error(f"User not authenticated. UID: {request.uid}")
                 return False
 
-            # Additional check: verify user exists and is active
+            # Additional check: verify user is active
             try:
-                user = request.env['res.users'].sudo().browse(request.uid)
-                if not user.exists() or not user.active:
-                    _logger.error(f"User {request.uid} does not exist or is inactive")
+                if not user.active:
+                    _logger.error(f"User {request.uid} is inactive")
                     return False
 
-                _logger.info(f"User authenticated successfully: {user.name} (ID: {user.id})")
+                _logger.info(f"User authenticated successfully (ID: {request.uid})")
                 return True
 
             except Exception as e:
@@ -390,7 +432,7 @@ class CartAPIController(http.Controller):
         }
         """
         try:
-            data = self._get_json_data()
+            data = _get_json_data()
             if not data:
                 data = kw
 
@@ -404,8 +446,9 @@ class CartAPIController(http.Controller):
                 return {'status': 'error', 'message': 'Product ID is required'}
 
             try:
-                product_id = int(data['product_id'])
-                quantity = float(data.get('quantity', 1))
+                params = _coerce_params(data, _ADD_TO_CART_PARAMS)
+                product_id = params['product_id']
+                quantity = params['quantity']
             except (ValueError, TypeError) as e:
                 _logger.error(f"Invalid data format: {e}")
                 return {'status': 'error', 'message': 'Invalid product_id or quantity format'}
@@ -414,10 +457,9 @@ class CartAPIController(http.Controller):
                 return {'status': 'error', 'message': 'Quantity must be greater than 0'}
 
             # Get current user's partner
-            user = request.env.user
-            partner = user.partner_id
+            partner_id, partner_name = request.env.user._get_api_partner_info()
 
-            _logger.info(f"Adding product {product_id} to cart for user {user.name} (partner {partner.id})")
+            _logger.info(f"Adding product {product_id} to cart for user {partner_name} (partner {partner_id})")
 
             # Validate product exists and is sellable
             product = request.env['product.product'].sudo().browse(product_id)
@@ -428,16 +470,19 @@ class CartAPIController(http.Controller):
                 return {'status': 'error', 'message': 'Product not available for sale'}
 
             # Get or create cart
-            cart = self._get_or_create_cart(partner.id)
+            cart = self._get_or_create_cart(partner_id)
 
             # Check if product already in cart
-            existing_line = cart.order_line.filtered(lambda l: l.product_id.id == product_id)
+            existing_line = request.env['sale.order.line'].sudo().search([
+                ('order_id', '=', cart.id),
+                ('product_id', '=', product_id),
+            ], limit=1)
 
             if existing_line:
                 # Update quantity
-                old_qty = existing_line[0].product_uom_qty
-                existing_line[0].product_uom_qty += quantity
-                _logger.info(f"Updated existing line: {old_qty} -> {existing_line[0].product_uom_qty}")
+                old_qty = existing_line.product_uom_qty
+                existing_line.product_uom_qty += quantity
+                _logger.info(f"Updated existing line: {old_qty} -> {existing_line.product_uom_qty}")
             else:
                 # Add new line
                 line_vals = {
@@ -473,12 +518,11 @@ class CartAPIController(http.Controller):
             if not self._authenticate_session():
                 return {'status': 'error', 'message': 'Authentication required'}
 
-            user = request.env.user
-            partner = user.partner_id
+            partner_id, partner_name = request.env.user._get_api_partner_info()
 
             # Get current cart
             cart = request.env['sale.order'].sudo().search([
-                ('partner_id', '=', partner.id),
+                ('partner_id', '=', partner_id),
                 ('state', '=', 'draft'),
             ], limit=1, order='write_date desc')
 
@@ -489,21 +533,32 @@ class CartAPIController(http.Controller):
                     'message': 'Cart is empty'
                 }
 
+            # Read lines and their products in batches instead of per line
+            order_lines = cart.order_line
+            line_rows = order_lines.read([
+                'product_id', 'product_uom_qty', 'price_unit', 'price_subtotal', 'price_total',
+            ])
+            products = order_lines.mapped('product_id')
+            product_rows = {row['id']: row for row in products.read(['name', 'default_code'])}
+            image_product_ids = _get_image_product_ids(products)
+
             # Format cart data
             cart_lines = []
-            base_url = request.httprequest.host_url.rstrip('/')
+            image_url_prefix = _get_image_url_prefix()
 
-            for line in cart.order_line:
+            for row in line_rows:
+                product_id = row['product_id'][0] if row['product_id'] else None
+                product = product_rows.get(product_id, {})
                 line_data = {
-                    'id': line.id,
-                    'product_id': line.product_id.id,
-                    'product_name': line.product_id.name,
-                    'product_sku': line.product_id.default_code or '',
-                    'quantity': line.product_uom_qty,
-                    'price_unit': float(line.price_unit),
-                    'price_subtotal': float(line.price_subtotal),
-                    'price_total': float(line.price_total),
-                    'image_url': f'{base_url}/web/image/product.product/{line.product_id.id}/image_1920' if line.product_id.image_1920 else None
+                    'id': row['id'],
+                    'product_id': product_id,
+                    'product_name': product.get('name') or '',
+                    'product_sku': product.get('default_code') or '',
+                    'quantity': row['product_uom_qty'],
+                    'price_unit': float(row['price_unit']),
+                    'price_subtotal': float(row['price_subtotal']),
+                    'price_total': float(row['price_total']),
+                    'image_url': image_url_prefix + str(product_id) + _IMAGE_URL_SUFFIX if product_id in image_product_ids else None
                 }
                 cart_lines.append(line_data)
 
@@ -515,8 +570,8 @@ class CartAPIController(http.Controller):
                 'tax_amount': float(cart.amount_tax),
                 'total': float(cart.amount_total),
                 'currency': cart.currency_id.name,
-                'items_count': len(cart.order_line),
-                'partner_name': partner.name
+                'items_count': len(order_lines),
+                'partner_name': partner_name
             }
 
             return {
@@ -532,40 +587,36 @@ class CartAPIController(http.Controller):
 # Additional utility endpoints
 class UtilityAPIController(http.Controller):
 
-    def _get_json_data(self):
-        """Helper method to extract JSON data from request"""
-        try:
-            if hasattr(request, 'get_json_data'):
-                return request.get_json_data()
-            elif hasattr(request, 'jsonrequest'):
-                return request.jsonrequest
-            elif request.httprequest.is_json:
-                return request.httprequest.get_json()
-            else:
-                raw_data = request.httprequest.get_data()
-                if raw_data:
-                    return json.loads(raw_data.decode('utf-8'))
-                return {}
-        except Exception as e:
-            _logger.error(f"Error getting JSON data: {e}")
-            return {}
+    def _get_category_list(self):
+        """Return the serialized categories, served from the category list cache when possible"""
+        dbname = request.env.cr.dbname
+        category_list = get_cached_category_list(dbname)
+        if category_list is not None:
+            return category_list
+
+        rows = request.env['product.category'].sudo().search([]).read(['name', 'parent_id', 'complete_name'])
+        names = {row['id']: row['name'] for row in rows}
+
+        category_list = []
+        for row in rows:
+            parent_id = row['parent_id'][0] if row['parent_id'] else None
+            category_data = {
+                'id': row['id'],
+                'name': row['name'],
+                'parent_id': parent_id,
+                'parent_name': names.get(parent_id) if parent_id else None,
+                'complete_name': row['complete_name']
+            }
+            category_list.append(category_data)
+
+        set_cached_category_list(dbname, category_list)
+        return category_list
 
     @http.route('/api/categories', type='json', auth='public', methods=['POST'], csrf=False)
     def list_categories(self, **kw):
         """List product categories"""
         try:
-            categories = request.env['product.category'].sudo().search([])
-
-            category_list = []
-            for category in categories:
-                category_data = {
-                    'id': category.id,
-                    'name': category.name,
-                    'parent_id': category.parent_id.id if category.parent_id else None,
-                    'parent_name': category.parent_id.name if category.parent_id else None,
-                    'complete_name': category.complete_name
-                }
-                category_list.append(category_data)
+            category_list = self._get_category_list()
 
             return {
                 'status': 'success',
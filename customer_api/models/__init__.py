@@ -0,0 +1,5 @@
+# models/__init__.py
+from . import product
+from . import res_partner
+from . import res_users
+from . import sale_order
@@ -0,0 +1,111 @@
+# models/product.py
+import time
+
+from odoo import api, models
+from odoo.tools.lru import LRU
+
+PRODUCT_PAGE_TTL = 60  # seconds
+CATEGORY_LIST_TTL = 60  # seconds
+
+# (expiry, result) of served product listing pages, keyed by request parameters
+_PRODUCT_PAGE_CACHE = LRU(256)
+
+# (expiry, category list) of the serialized categories, keyed by dbname
+_CATEGORY_LIST_CACHE = {}
+
+
+def get_cached_product_page(key):
+    """Return the cached product listing page for the key, or None"""
+    cached = _PRODUCT_PAGE_CACHE.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def set_cached_product_page(key, result):
+    """Cache a product listing page for PRODUCT_PAGE_TTL seconds"""
+    _PRODUCT_PAGE_CACHE[key] = (time.monotonic() + PRODUCT_PAGE_TTL, result)
+
+
+def clear_product_page_cache():
+    """Drop all cached product listing pages, run after the changing transaction commits"""
+    _PRODUCT_PAGE_CACHE.clear()
+
+
+def get_cached_category_list(dbname):
+    """Return the cached category list of the database, or None"""
+    cached = _CATEGORY_LIST_CACHE.get(dbname)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def set_cached_category_list(dbname, category_list):
+    """Cache the category list of the database for CATEGORY_LIST_TTL seconds"""
+    _CATEGORY_LIST_CACHE[dbname] = (time.monotonic() + CATEGORY_LIST_TTL, category_list)
+
+
+def clear_category_list_cache():
+    """Drop all cached category lists, run after the changing transaction commits"""
+    _CATEGORY_LIST_CACHE.clear()
+
+
+class ProductTemplate(models.Model):
+    _inherit = 'product.template'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return res
+
+
+class ProductProduct(models.Model):
+    _inherit = 'product.product'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return res
+
+
+class ProductCategory(models.Model):
+    _inherit = 'product.category'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.cr.postcommit.add(clear_category_list_cache)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.cr.postcommit.add(clear_category_list_cache)
+        self.env.cr.postcommit.add(clear_product_page_cache)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.cr.postcommit.add(clear_category_list_cache)
+        return res
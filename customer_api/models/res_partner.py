@@ -0,0 +1,29 @@
+# models/res_partner.py
+from odoo import models, tools
+
+from .res_users import invalidate_partner_info_on_commit
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    def init(self):
+        super().init()
+        # Supports the email lookup done on customer creation
+        tools.create_index(
+            self._cr, 'res_partner_api_email_person_index', self._table,
+            ['email'], where='is_company IS NOT TRUE',
+        )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'name' in vals:
+            invalidate_partner_info_on_commit(self._cr, self.sudo().user_ids.ids)
+        return res
+
+    def unlink(self):
+        # Linked users can no longer be read once the partners are deleted
+        user_ids = self.sudo().user_ids.ids
+        res = super().unlink()
+        invalidate_partner_info_on_commit(self._cr, user_ids)
+        return res
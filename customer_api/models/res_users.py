@@ -0,0 +1,54 @@
+# models/res_users.py
+import functools
+import time
+
+from odoo import models
+from odoo.tools.lru import LRU
+
+PARTNER_INFO_TTL = 60  # seconds
+
+# (expiry, partner id, partner name) of API users, keyed by (dbname, uid)
+_PARTNER_INFO_CACHE = LRU(10000)
+
+
+def invalidate_partner_info(dbname, user_ids):
+    """Drop the cached partner information of the given users"""
+    for uid in user_ids:
+        try:
+            _PARTNER_INFO_CACHE.pop((dbname, uid))
+        except KeyError:
+            pass
+
+
+def invalidate_partner_info_on_commit(cr, user_ids):
+    """Drop the cached partner information of the given users once the transaction commits"""
+    if user_ids:
+        cr.postcommit.add(functools.partial(invalidate_partner_info, cr.dbname, list(user_ids)))
+
+
+class ResUsers(models.Model):
+    _inherit = 'res.users'
+
+    def _get_api_partner_info(self):
+        """Return (partner id, partner name) of the user, cached for a short time"""
+        self.ensure_one()
+        key = (self._cr.dbname, self.id)
+        cached = _PARTNER_INFO_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+
+        partner = self.sudo().partner_id
+        _PARTNER_INFO_CACHE[key] = (time.monotonic() + PARTNER_INFO_TTL, partner.id, partner.name)
+        return partner.id, partner.name
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'partner_id' in vals:
+            invalidate_partner_info_on_commit(self._cr, self.ids)
+        return res
+
+    def unlink(self):
+        user_ids = self.ids
+        res = super().unlink()
+        invalidate_partner_info_on_commit(self._cr, user_ids)
+        return res
@@ -0,0 +1,26 @@
+# models/sale_order.py
+from odoo import models, tools
+
+
+class SaleOrder(models.Model):
+    _inherit = 'sale.order'
+
+    def init(self):
+        super().init()
+        # Supports the draft cart lookup done on every cart request
+        tools.create_index(
+            self._cr, 'sale_order_api_cart_index', self._table,
+            ['partner_id', 'write_date DESC'], where="state = 'draft'",
+        )
+
+
+class SaleOrderLine(models.Model):
+    _inherit = 'sale.order.line'
+
+    def init(self):
+        super().init()
+        # Supports finding the line of a product when adding to cart
+        tools.create_index(
+            self._cr, 'sale_order_line_api_order_product_index', self._table,
+            ['order_id', 'product_id'],
+        )
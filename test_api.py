@@ -5,9 +5,27 @@ Run this script to test all API endpoints
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
+import itertools
 import json
+import logging
+import os
 import sys
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse JSON responses with orjson when available, both accept bytes
+json_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 BASE_URL = "http://localhost:8097"
@@ -21,323 +39,517 @@ API_ENDPOINTS = {
     'health': '/api/health'
 }
 
+# Only requests carrying a JSON body declare its content type
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Read-only endpoints: safe to retry, and their repeated JSON bodies are encoded once
+READ_ONLY_ENDPOINTS = frozenset(['health', 'categories', 'list_products'])
+# How many encoded read-only bodies are kept
+ENCODED_BODY_CACHE_SIZE = 64
+
+# Session saved between runs to skip customer creation and login
+SESSION_CACHE_PATH = os.path.expanduser('~/.cache/odoo_api_test.json')
+SESSION_CACHE_TTL = 1800  # seconds
+
+
+# Random per-run token and per-process counter used to build unique emails
+_RUN_ID = uuid.uuid4().hex[:8]
+_email_counter = itertools.count()
+
+
+def unique_email(prefix):
+    """Return an email address that does not collide across runs, processes or threads"""
+    return f"{prefix}.{_RUN_ID}.{os.getpid()}.{next(_email_counter)}@example.com"
+
 
 class APITester:
-    def __init__(self, base_url):
+    def __init__(self, base_url, use_cache=False, adapter=None, read_adapter=None):
         self.base_url = base_url.rstrip('/')
+        # Full URL of every endpoint, keyed like API_ENDPOINTS
+        self._urls = {name: f"{self.base_url}{path}" for name, path in API_ENDPOINTS.items()}
         self.session = requests.Session()
+        # Keep enough pooled connections for concurrent tests, testers given adapters
+        # share their connection pools while keeping their own cookies
+        self.adapter = adapter or HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        # Only read-only endpoints retry transient gateway errors, a retried write
+        # (create, login, add to cart) could be applied twice by the server
+        self.read_adapter = read_adapter or HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST']),
+            ),
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        for name in READ_ONLY_ENDPOINTS:
+            self.session.mount(self._urls[name], self.read_adapter)
         self.session.headers.update({
-            'Content-Type': 'application/json',
             'User-Agent': 'Odoo API Tester'
         })
-        # Store authentication info
-        self.auth_cookies = None
+        # Store authentication info, the session keeps the cookies
         self.session_id = None
+        # JSON bodies of read-only endpoints already encoded, keyed by (endpoint, typed payload items)
+        self._encoded_bodies = {}
+        # Reuse the session of a previous run when asked to
+        self.use_cache = use_cache
+        self.has_cached_session = self._load_cache() if use_cache else False
+
+    def _load_cache(self):
+        """Restore a still valid session saved by a previous run, return True if found"""
+        try:
+            with open(SESSION_CACHE_PATH) as f:
+                entry = json.load(f).get(self.base_url)
+        except (OSError, ValueError):
+            return False
+        if not entry or entry.get('expires_at', 0) <= time.time():
+            return False
+        self.session.cookies.update(entry['cookies'])
+        self.session_id = entry.get('session_id')
+        return True
 
-    def make_request(self, endpoint, payload=None, method='POST', use_auth=True):
-        """Make API request and handle JSON-RPC format"""
-        url = f"{self.base_url}{endpoint}"
+    def check_cached_session(self):
+        """Check the server still accepts the restored session, drop it otherwise"""
+        logger.info("\nChecking cached session")
+        result = self.make_request('view_cart', {})
+        if result and result.get('status') == 'success':
+            logger.info("SUCCESS: Cached session accepted")
+            return True
+        logger.info("Cached session rejected, creating a new customer")
+        self.session.cookies.clear()
+        self.session_id = None
+        self.has_cached_session = False
+        return False
 
+    def _save_cache(self):
+        """Save the current session so following runs can skip creating and logging in"""
         try:
-            # Use stored cookies for authenticated requests
-            if use_auth and self.auth_cookies:
-                self.session.cookies.update(self.auth_cookies)
+            with open(SESSION_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache[self.base_url] = {
+            'cookies': self.session.cookies.get_dict(),
+            'session_id': self.session_id,
+            'expires_at': time.time() + SESSION_CACHE_TTL,
+        }
+        try:
+            os.makedirs(os.path.dirname(SESSION_CACHE_PATH), exist_ok=True)
+            # The file holds live session cookies, keep it readable by the owner only
+            fd = os.open(SESSION_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.chmod(SESSION_CACHE_PATH, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Could not save session cache: {e}")
+
+    def _encode_body(self, endpoint, payload):
+        """Encode a JSON request body, reusing the bytes of repeated read-only payloads"""
+        if payload is None:
+            return None
+        if endpoint not in READ_ONLY_ENDPOINTS:
+            # Writes (including credentials) are rarely repeated, never keep them around
+            return json.dumps(payload).encode()
+        try:
+            # Include value types so 2, 2.0 and True do not share an encoded body
+            key = (endpoint, frozenset((name, type(value), value) for name, value in payload.items()))
+        except TypeError:
+            # Payload holds unhashable values, encode it every time
+            return json.dumps(payload).encode()
+        body = self._encoded_bodies.get(key)
+        if body is None:
+            if len(self._encoded_bodies) >= ENCODED_BODY_CACHE_SIZE:
+                self._encoded_bodies.clear()
+            body = self._encoded_bodies.setdefault(key, json.dumps(payload).encode())
+        return body
+
+    def make_request(self, endpoint, payload=None, method='POST'):
+        """Make API request to the API_ENDPOINTS entry named `endpoint` and handle JSON-RPC format"""
+        url = self._urls[endpoint]
 
+        try:
             if method.upper() == 'POST':
-                response = self.session.post(url, json=payload)
+                response = self.session.post(
+                    url, data=self._encode_body(endpoint, payload), headers=JSON_HEADERS
+                )
             else:
                 response = self.session.get(url, params=payload)
 
-            print(f"Request to: {url}")
-            print(f"Payload: {json.dumps(payload, indent=2) if payload else 'None'}")
-            print(f"Status Code: {response.status_code}")
+            # Pretty-print full payloads and responses only when debug output is enabled
+            verbose = logger.isEnabledFor(logging.DEBUG)
+            logger.debug(f"Request to: {url}")
+            if verbose:
+                logger.debug(f"Payload: {json.dumps(payload, indent=2) if payload else 'None'}")
+            logger.debug(f"Status Code: {response.status_code} ({len(response.content)} bytes)")
 
-            # Store cookies from response for session persistence
-            if response.cookies:
-                if not self.auth_cookies:
-                    self.auth_cookies = {}
-                self.auth_cookies.update(response.cookies)
+            if response.status_code >= 400:
+                logger.error(f"Request failed: HTTP {response.status_code} for url: {url}")
+                try:
+                    logger.error(f"Error details: {json_loads(response.content)}")
+                except ValueError:
+                    logger.error(f"Response text: {response.text}")
+                return None
 
-            response.raise_for_status()
-            full_response = response.json()
-            print(f"Full Response: {json.dumps(full_response, indent=2)}")
+            full_response = json_loads(response.content)
+            if verbose:
+                logger.debug(f"Full Response: {json.dumps(full_response, indent=2)}")
 
             # Extract result from JSON-RPC envelope
             if 'result' in full_response:
                 return full_response['result']
             elif 'error' in full_response:
-                print(f"JSON-RPC Error: {full_response['error']}")
+                logger.error(f"JSON-RPC Error: {full_response['error']}")
                 return None
             else:
                 return full_response
 
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            logger.error(f"Request failed, server not reachable: {e}")
+            return None
         except requests.exceptions.RequestException as e:
-            print(f"Request failed: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_details = e.response.json()
-                    print(f"Error details: {json.dumps(error_details, indent=2)}")
-                except:
-                    print(f"Response text: {e.response.text}")
+            logger.error(f"Request failed: {e}")
+            return None
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {e}")
             return None
 
+    def _ok(self, result, label):
+        """Return True if the API call succeeded, otherwise log why it failed"""
+        if result and result.get('status') == 'success':
+            return True
+        logger.error(f"FAILED: {label} failed")
+        if result:
+            logger.error(f"Error: {result.get('message', 'Unknown error')}")
+        return False
+
     def test_health_check(self):
         """Test health check endpoint"""
-        print("\n" + "=" * 60)
-        print("Testing Health Check")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("Testing Health Check")
+        logger.info("=" * 60)
 
-        result = self.make_request(API_ENDPOINTS['health'], {}, use_auth=False)
+        result = self.make_request('health', {})
 
-        if result and result.get('status') == 'success':
-            print("SUCCESS: Health check passed")
-            print(f"Message: {result.get('message')}")
-            print(f"Timestamp: {result.get('timestamp')}")
-            return True
-        else:
-            print("FAILED: Health check failed")
+        if not self._ok(result, "Health check"):
             return False
 
+        logger.info("SUCCESS: Health check passed")
+        logger.info(f"Message: {result.get('message')}")
+        logger.info(f"Timestamp: {result.get('timestamp')}")
+        return True
+
     def test_create_customer(self, customer_data):
         """Test customer creation"""
-        print("\n" + "=" * 60)
-        print(f"Creating customer: {customer_data['email']}")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info(f"Creating customer: {customer_data['email']}")
+        logger.info("=" * 60)
 
-        result = self.make_request(API_ENDPOINTS['create_customer'], customer_data, use_auth=False)
+        result = self.make_request('create_customer', customer_data)
 
-        if result and result.get('status') == 'success':
-            print("SUCCESS: Customer created successfully")
-            print(f"Customer ID: {result.get('customer_id')}")
-            print(f"User ID: {result.get('user_id')}")
-            print(f"Email: {result.get('email')}")
-            return result
-        else:
-            print("FAILED: Customer creation failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
+        if not self._ok(result, "Customer creation"):
             return None
 
+        logger.info("SUCCESS: Customer created successfully")
+        logger.info(f"Customer ID: {result.get('customer_id')}")
+        logger.info(f"User ID: {result.get('user_id')}")
+        logger.info(f"Email: {result.get('email')}")
+        return result
+
     def test_login(self, credentials):
         """Test customer login"""
-        print("\n" + "=" * 60)
-        print(f"Logging in: {credentials['email']}")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info(f"Logging in: {credentials['email']}")
+        logger.info("=" * 60)
 
-        result = self.make_request(API_ENDPOINTS['login'], credentials, use_auth=False)
+        result = self.make_request('login', credentials)
 
-        if result and result.get('status') == 'success':
-            print("SUCCESS: Login successful")
-            print(f"Customer: {result.get('customer_name')}")
-            print(f"Customer ID: {result.get('customer_id')}")
-            print(f"User ID: {result.get('user_id')}")
-            print(f"Session Token: {result.get('session_token', 'N/A')}")
+        if not self._ok(result, "Login"):
+            return None
 
-            # Store session info for future requests
-            self.session_id = result.get('session_id')
-            print(f"Session ID stored: {self.session_id}")
+        logger.info("SUCCESS: Login successful")
+        logger.info(f"Customer: {result.get('customer_name')}")
+        logger.info(f"Customer ID: {result.get('customer_id')}")
+        logger.info(f"User ID: {result.get('user_id')}")
+        logger.info(f"Session Token: {result.get('session_token', 'N/A')}")
 
-            return result
-        else:
-            print("FAILED: Login failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
-            return None
+        # Store session info for future requests
+        self.session_id = result.get('session_id')
+        logger.info(f"Session ID stored: {self.session_id}")
+        if self.use_cache:
+            self._save_cache()
+
+        return result
 
     def test_list_products(self, filters=None):
         """Test product listing"""
-        print("\n" + "=" * 60)
-        print("Listing products")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("Listing products")
+        logger.info("=" * 60)
 
         payload = filters or {'limit': 10, 'offset': 0}
-        result = self.make_request(API_ENDPOINTS['list_products'], payload, use_auth=False)
+        result = self.make_request('list_products', payload)
 
-        if result and result.get('status') == 'success':
-            products = result.get('products', [])
-            total_count = result.get('total_count', 0)
-            print(f"SUCCESS: Found {len(products)} products (Total: {total_count})")
-
-            if products:
-                print("\nProducts found:")
-                for i, product in enumerate(products[:3], 1):
-                    print(f"  {i}. {product.get('name')} - ${product.get('price', 0):.2f}")
-                    print(f"     ID: {product.get('id')}, Category: {product.get('category', 'N/A')}")
-                    print(f"     SKU: {product.get('sku', 'N/A')}")
-            else:
-                print("No products found in database")
-                print("TIP: Add some products in Odoo to test cart functionality")
+        if not self._ok(result, "Product listing"):
+            return None
 
-            return result
+        products = result.get('products', [])
+        total_count = result.get('total_count', 0)
+        logger.info(f"SUCCESS: Found {len(products)} products (Total: {total_count})")
+
+        if products:
+            logger.info("\nProducts found:")
+            for i, product in enumerate(products[:3], 1):
+                get = product.get
+                logger.info(f"  {i}. {get('name')} - ${get('price', 0):.2f}")
+                logger.info(f"     ID: {get('id')}, Category: {get('category', 'N/A')}")
+                logger.info(f"     SKU: {get('sku', 'N/A')}")
         else:
-            print("FAILED: Product listing failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
-            return None
+            logger.info("No products found in database")
+            logger.info("TIP: Add some products in Odoo to test cart functionality")
+
+        return result
 
     def test_add_to_cart(self, product_id, quantity=1):
         """Test adding product to cart"""
-        print("\n" + "=" * 60)
-        print(f"Adding product {product_id} to cart (qty: {quantity})")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info(f"Adding product {product_id} to cart (qty: {quantity})")
+        logger.info("=" * 60)
 
         payload = {'product_id': product_id, 'quantity': quantity}
-        # Use authenticated request
-        result = self.make_request(API_ENDPOINTS['add_to_cart'], payload, use_auth=True)
+        result = self.make_request('add_to_cart', payload)
 
-        if result and result.get('status') == 'success':
-            print("SUCCESS: Product added to cart")
-            print(f"Product: {result.get('product_name')}")
-            print(f"Cart Total: ${result.get('cart_total', 0):.2f}")
-            print(f"Items Count: {result.get('cart_items_count', 0)}")
-            return result
-        else:
-            print("FAILED: Add to cart failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
+        if not self._ok(result, "Add to cart"):
             return None
 
+        logger.info("SUCCESS: Product added to cart")
+        logger.info(f"Product: {result.get('product_name')}")
+        logger.info(f"Cart Total: ${result.get('cart_total', 0):.2f}")
+        logger.info(f"Items Count: {result.get('cart_items_count', 0)}")
+        return result
+
     def test_view_cart(self):
         """Test viewing cart"""
-        print("\n" + "=" * 60)
-        print("Viewing cart")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("Viewing cart")
+        logger.info("=" * 60)
 
-        result = self.make_request(API_ENDPOINTS['view_cart'], {}, use_auth=True)
+        result = self.make_request('view_cart', {})
 
-        if result and result.get('status') == 'success':
-            cart = result.get('cart')
-            if cart:
-                print("SUCCESS: Cart retrieved successfully")
-                print(f"Cart ID: {cart.get('id')}")
-                print(f"Items: {cart.get('items_count', 0)}")
-                print(f"Subtotal: ${cart.get('subtotal', 0):.2f}")
-                print(f"Tax: ${cart.get('tax_amount', 0):.2f}")
-                print(f"Total: ${cart.get('total', 0):.2f}")
-                print(f"Currency: {cart.get('currency', 'N/A')}")
-
-                lines = cart.get('lines', [])
-                if lines:
-                    print("\nCart items:")
-                    for line in lines:
-                        print(
-                            f"  - {line.get('product_name')}: {line.get('quantity')} x ${line.get('price_unit'):.2f} = ${line.get('price_subtotal'):.2f}")
-            else:
-                print("SUCCESS: Cart is empty")
-            return result
-        else:
-            print("FAILED: View cart failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
+        if not self._ok(result, "View cart"):
             return None
 
+        cart = result.get('cart')
+        if cart:
+            logger.info("SUCCESS: Cart retrieved successfully")
+            logger.info(f"Cart ID: {cart.get('id')}")
+            logger.info(f"Items: {cart.get('items_count', 0)}")
+            logger.info(f"Subtotal: ${cart.get('subtotal', 0):.2f}")
+            logger.info(f"Tax: ${cart.get('tax_amount', 0):.2f}")
+            logger.info(f"Total: ${cart.get('total', 0):.2f}")
+            logger.info(f"Currency: {cart.get('currency', 'N/A')}")
+
+            lines = cart.get('lines', [])
+            if lines:
+                logger.info("\nCart items:")
+                for line in lines:
+                    logger.info(
+                        f"  - {line.get('product_name')}: {line.get('quantity')} x ${line.get('price_unit'):.2f} = ${line.get('price_subtotal'):.2f}")
+        else:
+            logger.info("SUCCESS: Cart is empty")
+        return result
+
     def test_list_categories(self):
         """Test category listing"""
-        print("\n" + "=" * 60)
-        print("Listing categories")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("Listing categories")
+        logger.info("=" * 60)
 
-        result = self.make_request(API_ENDPOINTS['categories'], {}, use_auth=False)
+        result = self.make_request('categories', {})
 
-        if result and result.get('status') == 'success':
-            categories = result.get('categories', [])
-            total_count = result.get('total_count', 0)
-            print(f"SUCCESS: Found {total_count} categories")
-
-            if categories:
-                print("\nCategories found:")
-                for category in categories[:5]:
-                    parent = f" (Parent: {category.get('parent_name')})" if category.get('parent_name') else ""
-                    print(f"  - {category.get('name')}{parent}")
-                    print(f"    ID: {category.get('id')}")
-            else:
-                print("No categories found")
+        if not self._ok(result, "Category listing"):
+            return None
 
-            return result
+        categories = result.get('categories', [])
+        total_count = result.get('total_count', 0)
+        logger.info(f"SUCCESS: Found {total_count} categories")
+
+        if categories:
+            logger.info("\nCategories found:")
+            for category in categories[:5]:
+                get = category.get
+                parent_name = get('parent_name')
+                parent = f" (Parent: {parent_name})" if parent_name else ""
+                logger.info(f"  - {get('name')}{parent}")
+                logger.info(f"    ID: {get('id')}")
         else:
-            print("FAILED: Category listing failed")
-            if result:
-                print(f"Error: {result.get('message', 'Unknown error')}")
-            return None
+            logger.info("No categories found")
+
+        return result
+
+    def bulk_create_customers(self, customers, max_workers=16):
+        """Create several customers concurrently, returning the results in order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.test_create_customer, customers))
+
+    def bulk_login(self, credentials_list, max_workers=16):
+        """Log in several customers concurrently, each with its own tester session"""
+        testers = [
+            APITester(self.base_url, adapter=self.adapter, read_adapter=self.read_adapter)
+            for _ in credentials_list
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(APITester.test_login, testers, credentials_list))
+        return list(zip(testers, results))
+
+
+def run_bulk_warmup(tester, count):
+    """Create and log in `count` customers concurrently, return True if all succeeded"""
+    customers = [{
+        "name": f"Warmup User {i}",
+        "email": unique_email("warmup.user"),
+        "phone": "1234567890",
+        "password": "password123"
+    } for i in range(count)]
+
+    created = tester.bulk_create_customers(customers)
+    credentials = [
+        {"email": customer["email"], "password": customer["password"]}
+        for customer, result in zip(customers, created) if result
+    ]
+    logged_in = [result for _, result in tester.bulk_login(credentials) if result]
+
+    logger.info(f"\nBulk warmup: {len(credentials)}/{count} created, {len(logged_in)}/{count} logged in")
+    return len(logged_in) == count
 
 
 def create_test_product():
     """Helper to suggest creating test products"""
-    print("\n" + "=" * 60)
-    print("TIP: Creating Test Products")
-    print("=" * 60)
-    print("To test cart functionality, you need products in Odoo.")
-    print("You can create them via:")
-    print("1. Odoo web interface: Inventory > Products > Create")
-    print("2. Odoo shell:")
-    print("   ./odoo-bin shell -d your_database")
-    print("   product = env['product.product'].create({")
-    print("       'name': 'Test Product',")
-    print("       'list_price': 99.99,")
-    print("       'sale_ok': True")
-    print("   })")
-
-
-def main():
+    logger.info("\n" + "=" * 60)
+    logger.info("TIP: Creating Test Products")
+    logger.info("=" * 60)
+    logger.info("To test cart functionality, you need products in Odoo.")
+    logger.info("You can create them via:")
+    logger.info("1. Odoo web interface: Inventory > Products > Create")
+    logger.info("2. Odoo shell:")
+    logger.info("   ./odoo-bin shell -d your_database")
+    logger.info("   product = env['product.product'].create({")
+    logger.info("       'name': 'Test Product',")
+    logger.info("       'list_price': 99.99,")
+    logger.info("       'sale_ok': True")
+    logger.info("   })")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Test the Odoo Customer API endpoints")
+    parser.add_argument(
+        '--verbose', action='store_true', default=os.environ.get('API_TEST_VERBOSE') == '1',
+        help="log every request with its full payload and response",
+    )
+    parser.add_argument(
+        '--mode', choices=['smoke', 'full', 'batch'], default='full',
+        help="smoke: health check and login of an existing customer, "
+             "full: every endpoint, batch: concurrent create and login of many customers",
+    )
+    parser.add_argument(
+        '--email', default=os.environ.get('API_TEST_EMAIL'),
+        help="email of an existing customer for smoke mode",
+    )
+    parser.add_argument(
+        '--password', default=os.environ.get('API_TEST_PASSWORD'),
+        help="password of an existing customer for smoke mode",
+    )
+    parser.add_argument(
+        '--users', type=int, default=int(os.environ.get('API_TEST_WARMUP_USERS', '10')),
+        help="number of customers created in batch mode",
+    )
+    parser.add_argument(
+        '--reuse-session', action='store_true',
+        help="in full mode, reuse the session saved by a previous run instead of "
+             "creating and logging in a new customer",
+    )
+    args = parser.parse_args(argv)
+    if args.mode == 'smoke' and not (args.email and args.password):
+        parser.error("smoke mode requires --email and --password (or API_TEST_EMAIL/API_TEST_PASSWORD)")
+    return args
+
+
+def run_smoke_tests(email, password):
+    """Check the API answers and an existing customer can log in"""
+    tester = APITester(BASE_URL)
+    passed = tester.test_health_check() and bool(tester.test_login({'email': email, 'password': password}))
+    logger.info(f"\nSmoke test {'passed' if passed else 'failed'}")
+    return passed
+
+
+def run_full_tests(reuse_session=False):
     """Run all API tests"""
-    print("Starting Odoo Customer API Tests")
-    print(f"Base URL: {BASE_URL}")
-    print("Testing all endpoints with detailed output...")
+    logger.info("Testing all endpoints with detailed output...")
 
-    tester = APITester(BASE_URL)
+    tester = APITester(BASE_URL, use_cache=reuse_session)
 
     # Generate unique email for this test run
-    timestamp = int(time.time())
     customer_data = {
         "name": "Test User",
-        "email": f"test.user.{timestamp}@example.com",
+        "email": unique_email("test.user"),
         "phone": "1234567890",
         "password": "password123"
     }
 
-    # Track test results
+    # Track test results, core results decide whether the run passes without cart features
     tests_passed = 0
     total_tests = 0
+    core_results = []
 
-    # 1. Health check
-    total_tests += 1
-    if tester.test_health_check():
-        tests_passed += 1
-
-    # 2. Create customer
-    total_tests += 1
-    create_result = tester.test_create_customer(customer_data)
-    if create_result:
-        tests_passed += 1
-
-    # 3. Login
-    total_tests += 1
-    login_credentials = {
-        "email": customer_data["email"],
-        "password": customer_data["password"]
-    }
-    login_result = tester.test_login(login_credentials)
-    if login_result:
+    # 1-2. Create customer and login, unless a previous run's session is still accepted
+    if tester.has_cached_session and tester.check_cached_session():
+        logger.info("\nReusing cached session, skipping customer creation and login")
+        total_tests += 1
         tests_passed += 1
+        core_results.append(True)
+    else:
+        # 1. Create customer
+        total_tests += 1
+        create_result = tester.test_create_customer(customer_data)
+        if create_result:
+            tests_passed += 1
 
-    # Only continue with authenticated tests if login was successful
-    if not login_result:
-        print("\n" + "=" * 60)
-        print("STOPPING: Cannot continue tests without successful login")
-        print("=" * 60)
-        print(f"\nFinal Results: {tests_passed}/{total_tests} tests passed")
-        return False
-
-    # 4. List categories
-    total_tests += 1
-    if tester.test_list_categories():
-        tests_passed += 1
+        # 2. Login
+        total_tests += 1
+        login_credentials = {
+            "email": customer_data["email"],
+            "password": customer_data["password"]
+        }
+        login_result = tester.test_login(login_credentials)
+        if login_result:
+            tests_passed += 1
+        core_results += [bool(create_result), bool(login_result)]
+
+        # Only continue with authenticated tests if login was successful
+        if not login_result:
+            logger.info("\n" + "=" * 60)
+            logger.error("STOPPING: Cannot continue tests without successful login")
+            logger.info("=" * 60)
+            logger.info(f"\nFinal Results: {tests_passed}/{total_tests} tests passed")
+            return False
 
-    # 5. List products
-    total_tests += 1
-    products_result = tester.test_list_products({'limit': 10})
-    if products_result:
-        tests_passed += 1
+    # 3-5. Health check, categories and products concurrently, they do not depend on each other
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'health': executor.submit(tester.test_health_check),
+            'categories': executor.submit(tester.test_list_categories),
+            'products': executor.submit(tester.test_list_products, {'limit': 10}),
+        }
+        results = {name: future.result() for name, future in futures.items()}
+    products_result = results['products']
+    core_results.append(bool(results['health']))
+
+    for result in results.values():
+        total_tests += 1
+        if result:
+            tests_passed += 1
 
     # 6. Add to cart (if products exist)
     if products_result and products_result.get('products'):
@@ -348,7 +560,7 @@ def main():
         if tester.test_add_to_cart(product_id, 2):
             tests_passed += 1
     else:
-        print("\nSKIPPING: Add to cart test (no products available)")
+        logger.info("\nSKIPPING: Add to cart test (no products available)")
         create_test_product()
 
     # 7. View cart
@@ -357,22 +569,37 @@ def main():
         tests_passed += 1
 
     # Final summary
-    print("\n" + "=" * 60)
-    print("FINAL TEST SUMMARY")
-    print("=" * 60)
-    print(f"Tests passed: {tests_passed}/{total_tests}")
+    logger.info("\n" + "=" * 60)
+    logger.info("FINAL TEST SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"Tests passed: {tests_passed}/{total_tests}")
 
     if tests_passed == total_tests:
-        print("STATUS: All tests passed successfully!")
+        logger.info("STATUS: All tests passed successfully!")
         return True
-    elif tests_passed >= 3:  # Health, create, login working
-        print("STATUS: Core functionality working! Some features need products in database.")
+    elif all(core_results):  # Authentication and health working
+        logger.info("STATUS: Core functionality working! Some features need products in database.")
         return True
     else:
-        print("STATUS: Some critical tests failed. Check the detailed output above.")
+        logger.info("STATUS: Some critical tests failed. Check the detailed output above.")
         return False
 
 
+def main(argv=None):
+    """Run the API tests of the selected mode"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s')
+
+    logger.info("Starting Odoo Customer API Tests")
+    logger.info(f"Base URL: {BASE_URL}")
+
+    if args.mode == 'smoke':
+        return run_smoke_tests(args.email, args.password)
+    if args.mode == 'batch':
+        return run_bulk_warmup(APITester(BASE_URL), args.users)
+    return run_full_tests(args.reuse_session)
+
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file